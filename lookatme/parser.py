@@ -4,6 +4,7 @@ This module defines the parser for the markdown presentation file
 
 
 import re
+import sys
 from collections import defaultdict
 from typing import AnyStr, Callable, Dict, List, Tuple
 
@@ -14,15 +15,33 @@ from lookatme.slide import Slide
 from lookatme.tutorial import tutor
 
 
+PROGRESSIVE_SLIDE_RE = re.compile(r"<!--\s*stop\s*-->")
+META_MARKER_RE = re.compile(r"----*")
+
+
+def _intern_token_types(tokens):
+    """Intern the ``type`` string of every token in the tree. The renderer
+    dispatches (and builds cache keys) off these strings for every token, and
+    interning lets those dict lookups short-circuit on identity.
+
+    :param list tokens: The parsed markdown tokens
+    """
+    stack = list(tokens)
+    while stack:
+        token = stack.pop()
+        token["type"] = sys.intern(token["type"])
+        children = token.get("children")
+        if children:
+            stack.extend(children)
+
+
 def is_progressive_slide_delimiter_token(token):
     """Returns True if the token indicates the end of a progressive slide
 
     :param dict token: The markdown token
     :returns: True if the token is a progressive slide delimiter
     """
-    return token["type"] == "block_html" and re.match(
-        r"<!--\s*stop\s*-->", token["raw"]
-    )
+    return token["type"] == "block_html" and PROGRESSIVE_SLIDE_RE.match(token["raw"])
 
 
 class Parser(object):
@@ -61,6 +80,7 @@ class Parser(object):
         )
 
         tokens = md(input_data)
+        _intern_token_types(tokens)
 
         num_thematic_breaks, hinfo = self._scan_for_smart_split(tokens)
         keep_split_token = True
@@ -253,7 +273,7 @@ class Parser(object):
             skipped_chars += len(line) + 1
             stripped_line = line.strip()
 
-            is_marker = re.match(r"----*", stripped_line) is not None
+            is_marker = META_MARKER_RE.match(stripped_line) is not None
             if is_marker:
                 if found_first:
                     # found the second one
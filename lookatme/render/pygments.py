@@ -2,7 +2,10 @@
 """
 
 
+import functools
+import logging
 import time
+from collections import OrderedDict
 
 import pygments
 import pygments.lexers
@@ -17,6 +20,13 @@ LEXER_CACHE = {}
 STYLE_CACHE = {}
 FORMATTER_CACHE = {}
 
+# rendered output keyed on the full inputs - lexing + formatting is by far
+# the most expensive step in a render pass, and decks re-render the same
+# code blocks on every slide revisit. Capped since keys embed the source
+# text itself.
+RENDERED_CACHE = OrderedDict()
+RENDERED_CACHE_MAX = 256
+
 
 def get_formatter(style_name):
     style = get_style(style_name)
@@ -56,12 +66,27 @@ def render_text(text, lang="text", style_name=None, plain=False):
     if style_name is None:
         style_name = config.get_style()["style"]
 
+    cache_key = (text, lang, style_name, plain)
+    cached = RENDERED_CACHE.get(cache_key)
+    if cached is not None:
+        # renders run on a thread pool - another worker may have evicted the
+        # key between the lookup and this touch
+        try:
+            RENDERED_CACHE.move_to_end(cache_key)
+        except KeyError:
+            pass
+        return cached
+
     lexer = get_lexer(lang)
     formatter, style_bg = get_formatter(style_name)
 
-    start = time.time()
-    code_tokens = lexer.get_tokens(text)
-    config.get_log().debug(f"Took {time.time()-start}s to render {len(text)} bytes")
+    log = config.get_log()
+    if log.isEnabledFor(logging.DEBUG):
+        start = time.time()
+        code_tokens = lexer.get_tokens(text)
+        log.debug("Took %ss to render %d bytes", time.time() - start, len(text))
+    else:
+        code_tokens = lexer.get_tokens(text)
 
     markup = []
     for x in formatter.formatgenerator(code_tokens):
@@ -80,9 +105,14 @@ def render_text(text, lang="text", style_name=None, plain=False):
         markup[-1] = (markup[-1][0], markup[-1][1][:-1])
 
     if plain:
-        return markup
+        res = markup
     else:
-        return urwid.AttrMap(urwid.Text(markup), urwid.AttrSpec("default", style_bg))
+        res = urwid.AttrMap(urwid.Text(markup), urwid.AttrSpec("default", style_bg))
+
+    RENDERED_CACHE[cache_key] = res
+    if len(RENDERED_CACHE) > RENDERED_CACHE_MAX:
+        RENDERED_CACHE.popitem(last=False)
+    return res
 
 
 class UrwidFormatter(Formatter):
@@ -124,10 +154,14 @@ class UrwidFormatter(Formatter):
         return rd * rd + gd * gd + bd * bd
 
     @classmethod
+    @functools.lru_cache(maxsize=1024)
     def findclosest(cls, colstr, colors=256):
         """Takes a hex string and finds the nearest color to it.
 
-        Returns a string urwid will recognize."""
+        Returns a string urwid will recognize.
+
+        The scan over the palette is pure in its inputs, and styles reuse
+        the same few dozen colors, so results are memoized."""
 
         rgb = int(colstr, 16)
         r = (rgb >> 16) & 0xFF
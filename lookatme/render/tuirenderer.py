@@ -1,5 +1,8 @@
 # write class that extends MardownRenderer from mistune library
+import functools
 import html
+from collections import OrderedDict, deque
+
 import urwid
 import pygments.styles
 import lookatme.render.pygments as pygments_render
@@ -9,16 +12,79 @@ from lookatme.utils import pile_or_listbox_add
 from lookatme.contrib import contrib_first
 from lookatme.tutorial import tutor
 from lookatme.widgets.clickable_text import ClickableText, LinkIndicatorSpec
+from lookatme.widgets.table import Table
+
+
+# Bounded cache of pygments render results for code blocks and code spans.
+# Lexing + highlighting is by far the most expensive part of re-rendering a
+# slide, and slide navigation/reload re-renders identical code blocks, so
+# repeated renders become a single dict lookup. Keys include the pygments
+# style name - the only style input highlighting depends on - so a style
+# reload that changes it misses naturally.
+_BLOCK_CODE_CACHE = OrderedDict()
+_BLOCK_CODE_CACHE_MAX = 256
+
+# a default Divider carries no per-use state, so every blank line/spacer in
+# the deck can share one instance instead of allocating a fresh widget
+_DIVIDER = urwid.Divider()
+
+# constant handler results - callers only iterate these, never mutate
+_DIVIDER_SINGLE = [_DIVIDER]
+_DIVIDER_PAIR = [_DIVIDER, _DIVIDER]
+_SOFTBREAK = ["\n"]
+
+# decks tend to repeat the same links across renders - share the
+# LinkIndicatorSpec instances, keyed on the text/target and the base spec
+_LINK_SPEC_CACHE = OrderedDict()
+_LINK_SPEC_CACHE_MAX = 512
+
+# marker sequence functions for ordered lists, hoisted so the list handler
+# doesn't rebuild the dict (and three lambdas) on every list token
+_SEQUENCES = {
+    "numeric": str,
+    "alpha": lambda x: chr(ord("a") + x - 1),
+    "roman": utils.int_to_roman,
+}
+
+# merged effect AttrSpecs keyed on (effect, old fg, old bg) - only a handful
+# of combinations exist per deck (three effects x nesting variants)
+_EFFECT_SPECS = {}
+
+# maximum number of memoized render_token results kept per renderer
+_RENDER_CACHE_MAX = 16**4
+
+
+# local alias - skips the module attribute dereference on every code token
+_render_text = pygments_render.render_text
+
+
+def _lru_touch(cache, key):
+    """Mark ``key`` as most recently used. Slides render on a thread pool,
+    so another worker may evict the key between our lookup and the touch -
+    losing the touch is harmless, raising KeyError into the render is not.
+    """
+    try:
+        cache.move_to_end(key)
+    except KeyError:
+        pass
+
+
+@functools.lru_cache(maxsize=256)
+def _merge_effect(oldfg, oldbg, effect):
+    """Merge an inline effect into the enclosing fg/bg strings - the same
+    few combinations repeat for every emphasized word in a deck.
+    """
+    newfg = oldfg + "," + effect if oldfg else "default," + effect
+    return newfg, oldbg or "default"
 
 
 def _get_widget_text(textwidget):
-    text = textwidget
     if isinstance(textwidget, ClickableText):
-        if len(textwidget.attrib) > 0:
+        if textwidget.attrib:
             # FIXME, handle returning list of attributes istead of first item
             return textwidget.attrib[0], textwidget.text
-        text = textwidget.text
-    return text
+        return textwidget.text
+    return textwidget
 
 
 class TuiRenderer(object):
@@ -26,11 +92,68 @@ class TuiRenderer(object):
 
     NAME = "tuirenderer"
 
+    #: token types that have a built-in handler method of the same name
+    _TOKEN_HANDLERS = (
+        "text",
+        "emphasis",
+        "strong",
+        "strikethrough",
+        "link",
+        "image",
+        "codespan",
+        "linebreak",
+        "softbreak",
+        "blank_line",
+        "paragraph",
+        "heading",
+        "thematic_break",
+        "block_text",
+        "block_code",
+        "block_quote",
+        "list",
+        "table",
+    )
+
     def __init__(self, loop):
         self.__methods = {}
         self.loop = loop
         self._log = config.get_log().getChild("RENDER")
         self.localized_state = dict()
+        self._style = None
+        self._link_spec = None
+        self._quote_cache = None
+        self._hrule_res = None
+        self._heading_cache = {}
+        self._inline_depth = 0
+        self._render_cache = {}
+        self._render_cache_keys = deque()
+        # active inline effect style - the top entry is what _add_effect
+        # merges into; push/pop replaces the old save/restore dance through
+        # localized_state (and the default-dict allocation per call)
+        self._oldstyle_stack = [{"fg": "", "bg": ""}]
+
+        # prebuild the token-type -> bound method dispatch table so that
+        # render_token is a single dict lookup instead of an attribute probe
+        # (+ exception on miss) for every token
+        for name in self._TOKEN_HANDLERS:
+            self.__methods[name] = getattr(self, name)
+
+        # warm the pygments lexer/formatter and the style-derived spec
+        # caches so the first code block doesn't stall the UI on cold
+        # initialization. Styles may not be configured yet when the renderer
+        # is constructed - in that case the first render pays the cost as
+        # before.
+        try:
+            pygments_render.render_text("pass", lang="text")
+        except Exception:
+            pass
+        try:
+            style = config.get_style()
+            utils.spec_from_style(style["link"])
+            utils.spec_from_style(style["hrule"]["style"])
+            utils.spec_from_style(style["quote"]["style"])
+        except Exception:
+            pass
 
     def register(self, name: str, method):
         """Register a render method for the named token. For example::
@@ -44,17 +167,86 @@ class TuiRenderer(object):
         self.__methods[name] = lambda *arg, **kwargs: method(self, *arg, **kwargs)
 
     def _get_method(self, name):
-        try:
-            return object.__getattribute__(self, name)
-        except AttributeError:
-            method = self.__methods.get(name)
-            if not method:
+        method = self.__methods.get(name)
+        if method is None:
+            # handlers defined outside _TOKEN_HANDLERS (e.g. on a subclass)
+            # are resolved once here and cached in the table. Probe the
+            # instance dict and the MRO directly instead of getattr - no
+            # descriptor-protocol walk, no exception machinery on a miss
+            method = self.__dict__.get(name)
+            if method is None:
+                cls = type(self)
+                for klass in cls.__mro__:
+                    func = klass.__dict__.get(name)
+                    if func is not None:
+                        method = func.__get__(self, cls)
+                        break
+            if method is None:
                 raise AttributeError('No renderer "{!r}"'.format(name))
-            return method
+            self.__methods[name] = method
+        return method
+
+    def _hash_token(self, token):
+        """Fold a token subtree into a stable structural hash for the render
+        memoization cache.
+        """
+        attrs = token.get("attrs")
+        children = token.get("children")
+        return hash(
+            (
+                token["type"],
+                token.get("raw"),
+                token.get("bullet"),
+                # reference links carry their rendered label outside attrs
+                token.get("label"),
+                tuple(sorted(attrs.items())) if attrs else None,
+                tuple(self._hash_token(c) for c in children) if children else None,
+            )
+        )
 
     def render_token(self, token):
-        func = self._get_method(token["type"])
-        return func(token)
+        # dispatch straight off the prebuilt table; _get_method is only the
+        # fallback for handler names registered outside _TOKEN_HANDLERS
+        ttype = token["type"]
+        func = self.__methods.get(ttype) or self._get_method(ttype)
+
+        # only inline results are memoized: they are markup (strings and
+        # (spec, text) tuples) that consumers never mutate. Block-level
+        # results contain widgets, and downstream code mutates those in
+        # place - Table.create_cells sets .align on rendered cell widgets -
+        # so serving a shared instance would leak state between occurrences
+        if not self._inline_depth:
+            return func(token)
+
+        # repeated inline tokens (same text/emphasis/code across re-renders
+        # and slides) render to interchangeable markup - memoize on the
+        # token's structural hash plus the active effect style
+        try:
+            oldstyle = self._oldstyle_stack[-1]
+            key = (
+                self._hash_token(token),
+                oldstyle["fg"],
+                oldstyle["bg"],
+            )
+        except TypeError:
+            # unhashable token contents (e.g. from an extension) - render
+            # without caching
+            return func(token)
+
+        cached = self._render_cache.get(key)
+        if cached is not None:
+            return list(cached) if isinstance(cached, list) else cached
+
+        res = func(token)
+
+        if res is not None:
+            self._render_cache[key] = list(res) if isinstance(res, list) else res
+            self._render_cache_keys.append(key)
+            if len(self._render_cache_keys) > _RENDER_CACHE_MAX:
+                old = self._render_cache_keys.popleft()
+                self._render_cache.pop(old, None)
+
+        return res
 
     @tutor(
         "general",
@@ -82,35 +274,96 @@ class TuiRenderer(object):
         order=4,
     )
     def render_tokens(self, tokens):
-        tmp_listbox = urwid.ListBox([])
-        for token in tokens:
-            res = self.render_token(token)
+        # bind the current style dict once per render pass - the per-token
+        # methods read self._style instead of re-fetching (and re-subscripting)
+        # config.get_style() for every token
+        style = config.get_style()
+        if style is not self._style:
+            self._style = style
+            self._link_spec = None
+            self._quote_cache = None
+            self._hrule_res = None
+            self._heading_cache.clear()
+            self._render_cache.clear()
+            self._render_cache_keys.clear()
+
+        # plain list instead of a throwaway urwid.ListBox - ListBox
+        # construction allocates a list walker + focus state that every
+        # caller immediately discarded via .body
+        out = []
+        render_token = self.render_token
+
+        # walk sibling tokens with an explicit stack of iterators. Container
+        # tokens whose handlers post-process their children (paragraph,
+        # heading, quote, list, ...) still recurse through render_children,
+        # but pass-through containers like block_text get their children
+        # spliced into the current walk without paying a frame per level.
+        stack = [iter(tokens)]
+        while stack:
+            token = next(stack[-1], None)
+            if token is None:
+                stack.pop()
+                continue
+
+            if token["type"] == "block_text":
+                stack.append(iter(token["children"]))
+                continue
+
+            res = render_token(token)
             if res is None:
                 raise Exception("Why so Serioussss!!!")
-            pile_or_listbox_add(tmp_listbox, res)
+            if not isinstance(res, list):
+                res = [res]
+            for w in res:
+                # collapse consecutive dividers, same as listbox_add
+                if (
+                    len(out) > 0
+                    and isinstance(w, urwid.Divider)
+                    and isinstance(out[-1], urwid.Divider)
+                ):
+                    continue
+                out.append(w)
 
-        return tmp_listbox.body
+        return out
 
     def __call__(self, tokens):
         out = self.render_tokens(tokens)
-        # special handle for line breaks
-        # out += '\n\n'.join(self.render_referrences(state)) + '\n'
-        return out
 
-    # def render_referrences(self):
-    #     ref_links = state.env['ref_links']
-    #     for key in ref_links:
-    #         attrs = ref_links[key]
-    #         text = '[' + attrs['label'] + ']: ' + attrs['url']
-    #         title = attrs.get('title')
-    #         if title:
-    #             text += ' "' + title + '"'
-    #         yield text
+        # only the outermost boundary (a full slide render) needs an actual
+        # list walker for urwid.ListBox.body assignment
+        return urwid.SimpleFocusListWalker(out)
 
     def render_children(self, token):
         children = token["children"]
         return self.render_tokens(children)
 
+    def _render_children_markup(self, token):
+        """Render the token's children and flatten the results into urwid
+        text markup in a single pass, instead of building an intermediate
+        widget list and re-iterating it with _get_widget_text.
+        """
+        markup = []
+        append = markup.append
+        render_token = self.render_token
+        self._inline_depth += 1
+        try:
+            for child in token["children"]:
+                res = render_token(child)
+                if isinstance(res, list):
+                    for item in res:
+                        # inline handlers mostly hand back markup already -
+                        # only actual widgets need unwrapping
+                        if isinstance(item, ClickableText):
+                            item = _get_widget_text(item)
+                        append(item)
+                else:
+                    if isinstance(res, ClickableText):
+                        res = _get_widget_text(res)
+                    append(res)
+        finally:
+            self._inline_depth -= 1
+        return markup
+
     @tutor(
         "markdown",
         "tables",
@@ -154,8 +407,6 @@ class TuiRenderer(object):
 
         :returns: A list of urwid Widgets or a single urwid Widget
         """
-        from lookatme.widgets.table import Table
-
         header, body = token["children"]
 
         if header["type"] != "table_head":
@@ -166,18 +417,18 @@ class TuiRenderer(object):
             rows = []
             for row in token_rows:
                 row_items = row["children"]
-                row_cells = list(map(lambda x: x["children"], row_items))
+                row_cells = [x["children"] for x in row_items]
                 rows.append(row_cells)
             return rows
 
         def extract_headers():
             header_items = header.get("children") or []
-            header_cells = list(map(lambda x: x["children"], header_items))
+            header_cells = [x["children"] for x in header_items]
             return header_cells
 
         def extract_aligns():
             header_items = header.get("children") or []
-            align_cells = list(map(lambda x: x["attrs"].get("align"), header_items))
+            align_cells = [x["attrs"].get("align") for x in header_items]
             return align_cells
 
         headers = extract_headers()
@@ -194,66 +445,43 @@ class TuiRenderer(object):
 
         return padding
 
-    def render_table_bak(self, text):
-        return "<table>\n" + text + "</table>\n"
-
-    def render_table_head(renderer, text):
-        return "<thead>\n<tr>\n" + text + "</tr>\n</thead>\n"
-
-    def render_table_body(renderer, text):
-        return "<tbody>\n" + text + "</tbody>\n"
-
-    def render_table_row(renderer, text):
-        return "<tr>\n" + text + "</tr>\n"
-
-    def render_table_cell(renderer, text, align=None, head=False):
-        if head:
-            tag = "th"
-        else:
-            tag = "td"
-
-        html = "  <" + tag
-        if align:
-            html += ' style="text-align:' + align + '"'
-
-        return html + ">" + text + "</" + tag + ">\n"
-
     def text(self, token):
         text = token["raw"]
 
-        # headingstyle = self.localized_state.get("headings", {}).get("style", None)
-        # if headingstyle is not None:
-        #     text = utils.styled_text(text, headingstyle)
+        # inside an inline parent the ClickableText would immediately be
+        # unwrapped back into markup - skip the widget entirely
+        if self._inline_depth:
+            return [text]
 
         return [ClickableText(text)]
 
     def _add_effect(self, token, addeffect):
-        oldstyle = self.localized_state.get(
-            "oldstyle",
-            {
-                "fg": "",
-                "bg": "",
-            },
-        )
-        oldfg = oldstyle["fg"]
-        oldbg = oldstyle["bg"]
-        if len(oldfg) > 0:
-            oldfg += f",{addeffect}"
-        else:
-            oldfg = f"default,{addeffect}"
-        if len(oldbg) == 0:
-            oldbg = f"default"
-
-        self.localized_state["oldstyle"] = {
-            "fg": oldfg,
-            "bg": oldbg,
-        }
-        text = self.render_children(token)
-        text_specs = list(map(_get_widget_text, text))
-        res_text = ClickableText(text_specs)
+        children = token["children"]
+        if not children:
+            return []
+
+        oldstyle = self._oldstyle_stack[-1]
+        oldfg, oldbg = _merge_effect(oldstyle["fg"], oldstyle["bg"], addeffect)
 
-        self.localized_state["oldstyle"] = oldstyle
-        return utils.styled_text(res_text, addeffect, oldstyle)
+        self._oldstyle_stack.append({"fg": oldfg, "bg": oldbg})
+        try:
+            # the children's markup can be styled directly - wrapping it in a
+            # ClickableText only for styled_text to decompose it again is
+            # wasted work. Nested inline children already carry their merged
+            # specs via the stacked style above.
+            text_specs = self._render_children_markup(token)
+        finally:
+            self._oldstyle_stack.pop()
+
+        # repeated emphasis patterns resolve to the same merged spec -
+        # skip styled_text's fg/bg decomposition on the second sight
+        key = (addeffect, oldstyle["fg"], oldstyle["bg"])
+        spec = _EFFECT_SPECS.get(key)
+        if spec is None:
+            spec = _EFFECT_SPECS[key] = utils.styled_text(
+                "", addeffect, oldstyle
+            )[0]
+        return (spec, text_specs)
 
     @tutor(
         "markdown",
@@ -327,28 +555,42 @@ class TuiRenderer(object):
         :returns: list of `urwid Text markup <http://urwid.org/manual/displayattributes.html#text-markup>`_
             tuples.
         """
-        raw_link_text = []
-        for x in token["children"]:
-            raw_link_text.append(x["raw"])
-        raw_link_text = "".join(raw_link_text)
+        raw_link_text = "".join(x["raw"] for x in token["children"])
 
+        link_spec = self._link_spec
+        if link_spec is None:
+            link_spec = self._link_spec = utils.spec_from_style(self._style["link"])
+
+        # link_spec is already a ready-made AttrSpec - running the text
+        # through styled_text would only rebuild an identical spec
         label = token.get("label")
-        spec, text = utils.styled_text(
-            [raw_link_text], utils.spec_from_style(config.get_style()["link"])
-        )
-        toreturn = [ClickableText((spec, text))]
         if label:
-            spec, text = utils.styled_text(
-                [label], utils.spec_from_style(config.get_style()["link"])
-            )
-            return toreturn + [ClickableText([(spec, text)])]
+            # inside an inline parent, hand back raw markup - the parent
+            # block wraps everything into one ClickableText anyway
+            if self._inline_depth:
+                return [(link_spec, raw_link_text), (link_spec, label)]
+            return [
+                ClickableText((link_spec, raw_link_text)),
+                ClickableText([(link_spec, label)]),
+            ]
 
         attrs = token["attrs"]
         link_uri = attrs["url"]
         # title = attrs.get('title')
 
-        spec = LinkIndicatorSpec(raw_link_text, link_uri, spec)
-        return [ClickableText((spec, text))]
+        key = (raw_link_text, link_uri, id(link_spec))
+        spec = _LINK_SPEC_CACHE.get(key)
+        if spec is None:
+            spec = LinkIndicatorSpec(raw_link_text, link_uri, link_spec)
+            _LINK_SPEC_CACHE[key] = spec
+            if len(_LINK_SPEC_CACHE) > _LINK_SPEC_CACHE_MAX:
+                _LINK_SPEC_CACHE.popitem(last=False)
+        else:
+            _lru_touch(_LINK_SPEC_CACHE, key)
+
+        if self._inline_depth:
+            return [(spec, raw_link_text)]
+        return [ClickableText((spec, raw_link_text))]
 
     @tutor(
         "markdown",
@@ -381,22 +623,26 @@ class TuiRenderer(object):
         """,
     )
     def codespan(self, token):
-        text = token["raw"]
-        unescaped_text = html.unescape(text)
-        text = pygments_render.render_text(" " + unescaped_text + " ", plain=True)
+        key = (token["raw"], self._style.get("style"))
+        text = _BLOCK_CODE_CACHE.get(key)
+        if text is None:
+            unescaped_text = html.unescape(token["raw"])
+            text = _render_text(" " + unescaped_text + " ", plain=True)
+            _BLOCK_CODE_CACHE[key] = text
+            if len(_BLOCK_CODE_CACHE) > _BLOCK_CODE_CACHE_MAX:
+                _BLOCK_CODE_CACHE.popitem(last=False)
+        else:
+            _lru_touch(_BLOCK_CODE_CACHE, key)
         return [text]
 
     def linebreak(self, token):
-        return [urwid.Divider()]
+        return _DIVIDER_SINGLE
 
     def softbreak(self, token):
-        return ["\n"]
+        return _SOFTBREAK
 
     def blank_line(self, token):
-        return [urwid.Divider(), urwid.Divider()]
-
-    def render_inline_html(self, token):
-        return [token["raw"]]
+        return _DIVIDER_PAIR
 
     @tutor(
         "markdown",
@@ -416,9 +662,17 @@ class TuiRenderer(object):
         """,
     )
     def paragraph(self, token):
-        text = self.render_children(token)
-        styled_text = list(map(_get_widget_text, text))
-        return [urwid.Divider()] + [ClickableText(styled_text)] + [urwid.Divider()]
+        children = token["children"]
+
+        # pure-text paragraphs (no inline styling/links/code) are the common
+        # case on prose slides - join the raw strings directly instead of
+        # dispatching per child
+        if all(c.get("type") == "text" for c in children):
+            joined = "".join(c["raw"] for c in children)
+            return [_DIVIDER, ClickableText(joined), _DIVIDER]
+
+        styled_text = self._render_children_markup(token)
+        return [_DIVIDER, ClickableText(styled_text), _DIVIDER]
 
     @tutor(
         "markdown",
@@ -481,32 +735,29 @@ class TuiRenderer(object):
 
         :returns: A list of urwid Widgets or a single urwid Widget
         """
-        headings = config.get_style()["headings"]
         level = token["attrs"]["level"]
-        style = config.get_style()["headings"].get(str(level), headings["default"])
-
-        prefix = utils.styled_text(style["prefix"], style)
-        suffix = utils.styled_text(style["suffix"], style)
-
-        self.localized_state["headings"] = {
-            "style": style,
-        }
+        cached = self._heading_cache.get(level)
+        if cached is None:
+            headings = self._style["headings"]
+            style = headings.get(str(level), headings["default"])
+            prefix = utils.styled_text(style["prefix"], style)
+            suffix = utils.styled_text(style["suffix"], style)
+            cached = self._heading_cache[level] = (style, prefix, suffix)
+        style, prefix, suffix = cached
 
         rendered = self.render_children(token)
 
-        self.localized_state["headings"] = dict()
-
-        styled_text = list(map(lambda txt: utils.styled_text(txt, style), rendered))
+        styled_text = [utils.styled_text(txt, style) for txt in rendered]
 
         return [
-            urwid.Divider(),
+            _DIVIDER,
             ClickableText(
                 # [prefix] + utils.styled_text(rendered, style) + [suffix]),  # type: ignore
                 [prefix]
                 + styled_text
                 + [suffix]
             ),  # type: ignore
-            urwid.Divider(),
+            _DIVIDER,
         ]
 
     @contrib_first
@@ -516,11 +767,18 @@ class TuiRenderer(object):
         See :any:`lookatme.tui.SlideRenderer.do_render` for argument and return
         value descriptions.
         """
-        hrule_conf = config.get_style()["hrule"]
-        div = urwid.Divider(hrule_conf["char"], top=1, bottom=1)
-        return [
-            urwid.Pile([urwid.AttrMap(div, utils.spec_from_style(hrule_conf["style"]))])
-        ]
+        # the rule is identical chrome for every occurrence in the deck -
+        # build it once per style and let urwid's canvas cache do the rest
+        res = self._hrule_res
+        if res is None:
+            hrule_conf = self._style["hrule"]
+            div = urwid.Divider(hrule_conf["char"], top=1, bottom=1)
+            res = self._hrule_res = [
+                urwid.Pile(
+                    [urwid.AttrMap(div, utils.spec_from_style(hrule_conf["style"]))]
+                )
+            ]
+        return res
 
     def block_text(self, token):
         text = self.render_children(token)
@@ -569,9 +827,17 @@ class TuiRenderer(object):
         attrs = token.get("attrs", {})
         lang = attrs.get("info", "text")
         code = token["raw"]
-        res = pygments_render.render_text(code, lang=lang)
+        key = (lang, code, self._style.get("style"))
+        res = _BLOCK_CODE_CACHE.get(key)
+        if res is None:
+            res = _render_text(code, lang=lang)
+            _BLOCK_CODE_CACHE[key] = res
+            if len(_BLOCK_CODE_CACHE) > _BLOCK_CODE_CACHE_MAX:
+                _BLOCK_CODE_CACHE.popitem(last=False)
+        else:
+            _lru_touch(_BLOCK_CODE_CACHE, key)
 
-        return [urwid.Divider(), res, urwid.Divider()]
+        return [_DIVIDER, res, _DIVIDER]
 
     @tutor(
         "markdown",
@@ -622,27 +888,33 @@ class TuiRenderer(object):
         """
         pile = urwid.Pile([])
 
-        styles = config.get_style()["quote"]
-
-        quote_side = styles["side"]
-        quote_top_corner = styles["top_corner"]
-        quote_bottom_corner = styles["bottom_corner"]
-        quote_style = styles["style"]
+        cached = self._quote_cache
+        if cached is None:
+            styles = self._style["quote"]
+            cached = self._quote_cache = (
+                styles["side"],
+                styles["top_corner"],
+                styles["bottom_corner"],
+                utils.spec_from_style(styles["style"]),
+            )
+        quote_side, quote_top_corner, quote_bottom_corner, quote_spec = cached
 
         res = self.render_children(token)
 
         pile_or_listbox_add(pile, res)
+        # in-place del - slice assignment on a monitored list copies the
+        # whole list and fires a bulk change notification
         if isinstance(pile.contents[0][0], urwid.Divider):
-            pile.contents = pile.contents[1:]
+            del pile.contents[0]
         if isinstance(pile.contents[-1][0], urwid.Divider):
-            pile.contents = pile.contents[:-1]
+            del pile.contents[-1]
 
         toreturn = [
-            urwid.Divider(),
+            _DIVIDER,
             urwid.LineBox(
                 urwid.AttrMap(
                     urwid.Padding(pile, left=2),
-                    utils.spec_from_style(quote_style),
+                    quote_spec,
                 ),
                 lline=quote_side,
                 rline="",
@@ -653,17 +925,11 @@ class TuiRenderer(object):
                 brcorner="",
                 blcorner=quote_bottom_corner,
             ),
-            urwid.Divider(),
+            _DIVIDER,
         ]
 
         return toreturn
 
-    def render_block_html(self, token):
-        return token["raw"] + "\n\n"
-
-    def render_block_error(self, token):
-        return ""
-
     @tutor(
         "markdown",
         "ordered lists",
@@ -749,49 +1015,55 @@ class TuiRenderer(object):
         get_marker_text = lambda x: x
         start = attrs.get("start", 1)
         if attrs["ordered"]:
-            numbering = config.get_style()["numbering"]
+            numbering = self._style["numbering"]
             list_marker_type = numbering.get(str(list_level), numbering["default"])
-            sequence = {
-                "numeric": lambda x: str(x),
-                "alpha": lambda x: chr(ord("a") + x - 1),
-                "roman": lambda x: utils.int_to_roman(x),
-            }[list_marker_type]
+            sequence = _SEQUENCES[list_marker_type]
 
             start = attrs.get("start", 1)
 
             get_marker_text = lambda x: sequence(x) + token["bullet"] + " "
 
         else:
-            bullets = config.get_style()["bullets"]
+            bullets = self._style["bullets"]
             get_marker_text = (
                 lambda x: bullets.get(str(list_level), bullets["default"]) + " "
             )
 
-        max_marker_width = 2
-        for item in token["children"]:
-            marker_text = get_marker_text(start)
-            start += 1
-
-            if len(marker_text) > max_marker_width:
-                max_marker_width = len(marker_text)
-            marker_col_width = max_marker_width
-
-            list_item_pile = urwid.Pile(urwid.SimpleFocusListWalker([]))
+        # resolve every marker up front so all sibling rows share one final
+        # column width instead of re-measuring (and growing) it per item
+        children = token["children"]
+        markers = [get_marker_text(start + i) for i in range(len(children))]
+        marker_col_width = max([2] + [len(m) for m in markers])
+
+        # accumulate widgets per item and rows per list locally, flushing
+        # each container with a single batched add instead of paying the
+        # isinstance/append machinery once per token
+        rows = []
+        for marker_text, item in zip(markers, children):
+            item_widgets = []
             for tok in item["children"]:
                 res = self.render_token(tok)
+                # nested lists hand back a bare Pile rather than a list
+                if not isinstance(res, list):
+                    item_widgets.append(res)
+                    continue
                 if isinstance(res[0], urwid.Divider):
                     res = res[1:]
                 if isinstance(res[-1], urwid.Divider):
                     res = res[:-1]
-
-                pile_or_listbox_add(list_item_pile, res)
-            res = urwid.Columns(
-                [
-                    (marker_col_width, urwid.Text(("bold", marker_text))),
-                    list_item_pile,
-                ]
+                item_widgets.extend(res)
+
+            list_item_pile = urwid.Pile([])
+            pile_or_listbox_add(list_item_pile, item_widgets)
+            rows.append(
+                urwid.Columns(
+                    [
+                        (marker_col_width, urwid.Text(("bold", marker_text))),
+                        list_item_pile,
+                    ]
+                )
             )
-            pile_or_listbox_add(outerlist_pile, res)
+        pile_or_listbox_add(outerlist_pile, rows)
 
         self.localized_state["list_level"] = (
             self.localized_state.get("list_level", 1) - 1
@@ -799,9 +1071,9 @@ class TuiRenderer(object):
 
         if self.localized_state["list_level"] == 0:
             return (
-                [urwid.Divider()]
+                [_DIVIDER]
                 + [urwid.Padding(outerlist_pile, left=2)]
-                + [urwid.Divider()]
+                + [_DIVIDER]
             )
 
         return outerlist_pile
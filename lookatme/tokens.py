@@ -1,22 +1,27 @@
-tokentypes = {"marker", "attrs", "children", "bullet", "tight", "style", "raw", "type"}
+from collections import deque
 
 
-def get_token_types(self, tokens):
+# the keys a mistune AST token dict may carry - immutable, so share one
+# frozen instance
+tokentypes = frozenset(
+    {"marker", "attrs", "children", "bullet", "tight", "style", "raw", "type"}
+)
+
+
+def get_token_types(tokens):
     """Get the token types from the provided tokens
 
-    :param list tokens: The tokens to get types for
-    :returns: list of token types
+    :param list tokens: The token (or list of tokens) to get types for
+    :returns: list of leaf token types, in document order
     """
     types = []
-    if "children" in tokens:
-        for child in tokens["children"]:
-            types.extend(self.get_token_types(child))
-    else:
-        types.append(tokens["type"])
+    queue = deque(tokens if isinstance(tokens, list) else [tokens])
+    while queue:
+        token = queue.popleft()
+        children = token.get("children")
+        if children:
+            # keep depth-first document order without a Python frame per level
+            queue.extendleft(reversed(children))
+        else:
+            types.append(token["type"])
     return types
-
-
-def get_token_types(self, tokens):
-    alltokens = []
-    for token in tokens:
-        alltokens.extend(token)
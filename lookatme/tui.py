@@ -3,10 +3,11 @@ This module defines the text user interface (TUI) for lookatme
 """
 
 
-import copy
+import os
 import threading
 import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from queue import Queue
 
 import urwid
@@ -17,7 +18,7 @@ import lookatme.contrib
 from lookatme.render.tuirenderer import TuiRenderer
 from lookatme.contrib import contrib_first
 from lookatme.tutorial import tutor
-from lookatme.utils import pile_or_listbox_add, spec_from_style
+from lookatme.utils import spec_from_style
 
 
 def text(style, data, align="left"):
@@ -50,11 +51,21 @@ class SlideRenderer(threading.Thread):
         self.renderer = TuiRenderer(loop)
         self._log = lookatme.config.get_log().getChild("RENDER")
 
+        # queued slides are independent token lists, so they can be rendered
+        # concurrently. TuiRenderer keeps per-render state on itself, so each
+        # worker thread gets its own instance.
+        self._pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+        self._thread_renderers = threading.local()
+        self._generation = 0
+
     def flush_cache(self):
         """Clea everything out of the queue and the cache."""
         # clear all pending items
         with self.queue.mutex:
             self.queue.queue.clear()
+        # renders still in flight belong to the old generation and get
+        # discarded instead of repopulating the cache we just cleared
+        self._generation += 1
         self.cache.clear()
 
     def queue_render(self, slide):
@@ -78,21 +89,47 @@ class SlideRenderer(threading.Thread):
 
     def stop(self):
         self.keep_running.clear()
+        # drop queued prerenders and let in-flight ones finish without
+        # blocking - pool workers are not daemons, so leaving them with a
+        # backlog would stall interpreter exit until every slide rendered
+        self._pool.shutdown(wait=False, cancel_futures=True)
 
     def run(self):
         """Run the main render thread"""
         self.keep_running.set()
         while self.keep_running.is_set():
             to_render = self.queue.get()
-            slide_num = to_render.number
-
             try:
-                res = self.do_render(to_render, slide_num)
-                self.cache[slide_num] = res
-            except Exception as e:
-                self.cache[slide_num] = e
-            finally:
-                self.events[slide_num].set()
+                self._pool.submit(self._render_task, to_render, self._generation)
+            except RuntimeError:
+                # pool already shut down (stop() was called) - render the
+                # remaining request on this thread so waiters are released
+                self._render_task(to_render, self._generation)
+
+    def _get_thread_renderer(self):
+        """Return the TuiRenderer instance owned by the current worker
+        thread, creating it on first use.
+        """
+        renderer = getattr(self._thread_renderers, "renderer", None)
+        if renderer is None:
+            renderer = self._thread_renderers.renderer = TuiRenderer(self.loop)
+        return renderer
+
+    def _render_task(self, to_render, generation):
+        """Render a single queued slide on a pool worker and publish the
+        result, unless the cache was flushed while the render was in flight.
+        """
+        slide_num = to_render.number
+        try:
+            res = self.do_render(to_render, slide_num)
+        except Exception as e:
+            res = e
+
+        if generation != self._generation:
+            return
+
+        self.cache[slide_num] = res
+        self.events[slide_num].set()
 
     def do_render(self, to_render, slide_num):
         """Perform the actual rendering of a slide. This is done by:
@@ -132,17 +169,17 @@ class SlideRenderer(threading.Thread):
           * ``urwid.Widget`` - A single widget to render. Will be added to
             ``stack[-1]`` automatically.
         """
-        self._log.debug(f"Rendering slide {slide_num}")
+        self._log.debug("Rendering slide %s", slide_num)
         start = time.time()
 
         # initial processing loop - results are discarded, but render functions
         # may add extra metadata to the token itself. For example, list rendering
         # uses this to determine the max indent size for each level.
         tokens = to_render.tokens
-        res = self.renderer(tokens)
+        res = self._get_thread_renderer()(tokens)
 
         total = time.time() - start
-        self._log.debug(f"Rendered slide {slide_num} in {total}")
+        self._log.debug("Rendered slide %s in %s", slide_num, total)
 
         return res
 
@@ -317,7 +354,7 @@ class MarkdownTui(urwid.Frame):
 
     def keypress(self, size, key):
         """Handle keypress events"""
-        self._log.debug(f"KEY: {key}")
+        self._log.debug("KEY: %s", key)
         key = self._get_key(size, key)
         if key is None:
             return
@@ -329,6 +366,7 @@ class MarkdownTui(urwid.Frame):
             slide_direction = 1
         elif key in ["q", "Q"]:
             lookatme.contrib.shutdown_contribs()
+            self.slide_renderer.stop()
             raise urwid.ExitMainLoop()
         elif key == "r":
             self.reload()
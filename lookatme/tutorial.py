@@ -14,6 +14,12 @@ import lookatme.config as config
 import lookatme.utils as utils
 
 
+TUTOR_TAG_RE = re.compile(
+    "<(?P<tag>TUTOR:(?P<type>[A-Z_]+))>(?P<inner>.*)</(?P=tag)>",
+    re.MULTILINE | re.DOTALL,
+)
+
+
 class Tutor:
     """A class to handle/process tutorials for specific functionality
 
@@ -38,11 +44,22 @@ class Tutor:
         """
         self.name = name
         self.group = group
-        self.slides_md = inspect.cleandoc(slides_md).strip()
+        self._raw_slides_md = slides_md
+        self._slides_md: Optional[str] = None
         self.impl_fn = impl_fn
         self.order = order
         self.lazy_formatting = lazy_formatting
 
+    @property
+    def slides_md(self) -> str:
+        """The cleaned markdown for this tutor. Cleaning the (large) raw
+        docstrings is deferred until a tutorial is actually rendered so that
+        the many ``@tutor`` decorations don't pay the cost at import time.
+        """
+        if self._slides_md is None:
+            self._slides_md = inspect.cleandoc(self._raw_slides_md).strip()
+        return self._slides_md
+
     def get_md(self, rendered_example=True) -> str:
         """Get the tutor's markdown text after resolving any special markup
         contained in it.
@@ -62,8 +79,7 @@ class Tutor:
 
         res_md = []
         last_idx = 0
-        regex = "<(?P<tag>TUTOR:(?P<type>[A-Z_]+))>(?P<inner>.*)</(?P=tag)>"
-        for match in re.finditer(regex, slides_md, re.MULTILINE | re.DOTALL):
+        for match in TUTOR_TAG_RE.finditer(slides_md):
             res_md.append(slides_md[last_idx : match.start()])
             match_groups = match.groupdict()
             handler = tag_handlers.get(match_groups["type"], None)
@@ -2,6 +2,8 @@
 """
 
 
+import functools
+
 import urwid
 
 
@@ -45,35 +47,60 @@ def dict_deep_update(to_update, new_vals):
             to_update[key] = value
 
 
+SPEC_CACHE = {}
+
+
 def spec_from_style(styles):
     """Create an urwid.AttrSpec from a {fg:"", bg:""} style dict. If styles
     is a string, it will be used as the foreground
+
+    AttrSpecs are never mutated once built, so identical (fg, bg) pairs
+    share one cached instance instead of re-running urwid's color parsing.
     """
     if isinstance(styles, str):
-        return urwid.AttrSpec(styles, "")
+        key = (styles, "")
     else:
-        return urwid.AttrSpec(styles.get("fg", ""), styles.get("bg", ""))
+        key = (styles.get("fg", ""), styles.get("bg", ""))
+
+    spec = SPEC_CACHE.get(key)
+    if spec is None:
+        spec = SPEC_CACHE[key] = urwid.AttrSpec(key[0], key[1])
+    return spec
+
+
+FG_BG_CACHE = {}
+
+
+def _non_empty_split(data):
+    res = [x.strip() for x in data.split(",")]
+    return list(filter(None, res))
 
 
 def get_fg_bg_styles(style):
     if style is None:
         return [], []
 
-    def non_empty_split(data):
-        res = [x.strip() for x in data.split(",")]
-        return list(filter(None, res))
-
     # from lookatme.config.get_style()
     if isinstance(style, dict):
-        return non_empty_split(style["fg"]), non_empty_split(style["bg"])
+        key = (style["fg"], style["bg"])
     # just a str will only set the foreground color
     elif isinstance(style, str):
-        return non_empty_split(style), []
+        key = (style, "")
     elif isinstance(style, urwid.AttrSpec):
-        return non_empty_split(style.foreground), non_empty_split(style.background)
+        key = (style.foreground, style.background)
     else:
         raise ValueError("Unsupported style value {!r}".format(style))
 
+    # styled_text re-decomposes the same handful of styles for every inline
+    # token - memoize the split lists (callers only concatenate them)
+    cached = FG_BG_CACHE.get(key)
+    if cached is None:
+        cached = FG_BG_CACHE[key] = (
+            _non_empty_split(key[0]),
+            _non_empty_split(key[1]),
+        )
+    return cached
+
 
 def overwrite_spec(orig_spec, new_spec):
     if orig_spec is None:
@@ -217,6 +244,7 @@ def pile_add(pile, widgets):
         pile.contents.append((w, pile.options()))
 
 
+@functools.lru_cache(maxsize=256)
 def int_to_roman(integer):
     integer = int(integer)
     ints = [1000, 900, 500, 400, 100, 90, 50, 40, 10, 9, 5, 4, 1]
@@ -400,3 +400,63 @@ def test_inline(tmpdir, mocker):
     rendered = render_markdown("![link](http://domain.tld)")
     assert rendered[1][0][0].foreground == "default,underline"
     assert row_text(rendered[1]).rstrip() == b"link"
+
+
+def test_table_cell_alignment(tmpdir, mocker):
+    """Test that identical cell text in differently-aligned columns renders
+    with each column's own alignment (regression test for the render memo
+    cache serving one shared widget to both columns)
+    """
+    setup_lookatme(
+        tmpdir,
+        mocker,
+        style={
+            "table": {
+                "column_spacing": 1,
+                "header_divider": "-",
+            },
+        },
+    )
+
+    rendered = render_markdown(
+        """
+| aaaaaaaa | bbbbbbbb |
+|:---------|---------:|
+| x        | x        |
+"""
+    )
+
+    stripped_rows = [
+        b"",
+        b"aaaaaaaa bbbbbbbb",
+        b"-------- --------",
+        b"x               x",
+    ]
+    assert_render(stripped_rows, rendered, full_strip=True)
+
+
+def test_reference_link_labels(tmpdir, mocker):
+    """Test that reference links differing only in their label don't collapse
+    into one rendered link (regression test for the render memo cache hashing
+    tokens without the label)
+    """
+    setup_lookatme(
+        tmpdir,
+        mocker,
+        style={
+            "style": "monokai",
+            "link": {
+                "fg": "underline",
+                "bg": "default",
+            },
+        },
+    )
+
+    rendered = render_markdown(
+        """*[x][ref1] and [x][ref2]*
+
+[ref1]: http://a
+[ref2]: http://a
+"""
+    )
+    assert row_text(rendered[1]).strip() == b"xref1 and xref2"